@@ -13,19 +13,240 @@
 # limitations under the License.
 #
 """Authentication handling for Google SecOps SDK."""
-from typing import Optional, Dict, Any, List
+import functools
+import random
+import threading
+import weakref
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Tuple
 from google.auth.credentials import Credentials
 from google.oauth2 import service_account
 import google.auth
+import google.auth.exceptions
 import google.auth.transport.requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from secops.exceptions import AuthenticationError
 
 # Define default scopes needed for Chronicle API
 CHRONICLE_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
 
+# Default connection pool sizing for the authorized session
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 64
+
+# Fraction of a token's remaining lifetime after which it is refreshed
+# in the background, and the maximum jitter subtracted from that fraction
+REFRESH_LIFETIME_FRACTION = 0.8
+REFRESH_JITTER_FRACTION = 0.05
+
+# Serializes session creation so concurrent callers share a single session
+_SESSION_LOCK = threading.Lock()
+
+# Sessions shared across SecOpsAuth instances, kept only while in use
+_SHARED_SESSIONS: "weakref.WeakValueDictionary[Tuple[Any, ...], Any]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_default_credentials(scopes: Tuple[str, ...]) -> Credentials:
+    """Load application default credentials once per set of scopes."""
+    credentials, _ = google.auth.default(scopes=list(scopes))
+    return credentials
+
+
+@functools.lru_cache(maxsize=8)
+def _load_sa_file(path: str, scopes: Tuple[str, ...]) -> Credentials:
+    """Load service account credentials once per key file and scopes."""
+    return service_account.Credentials.from_service_account_file(
+        path, scopes=list(scopes)
+    )
+
+
+class _IdempotentRetry(Retry):
+    """Retry policy that never re-sends a POST the server may have processed.
+
+    POST requests (log imports, forwarder and rule creation, etc.) are not
+    idempotent, so they are only retried after a connection error or a 429,
+    where the server has not acted on the request. Idempotent methods are
+    also retried on 5xx responses and read errors.
+    """
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method.upper() == "POST":
+            return bool(self.total) and status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _create_adapter(pool_connections: int, pool_maxsize: int) -> HTTPAdapter:
+    """Create an HTTP adapter with a tuned connection pool and retries.
+
+    Final responses are returned rather than raised once retries are
+    exhausted, so callers keep handling error status codes themselves.
+    """
+    retry = _IdempotentRetry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+
+
+class _TokenRefresher:
+    """Refreshes credentials in the background before their token expires.
+
+    A refresh is only scheduled from a request, so refreshing stops once the
+    session is no longer used. If a scheduled refresh is missed or fails,
+    google-auth still refreshes the token inline on the next request once it
+    has expired.
+    """
+
+    def __init__(self, credentials: Credentials):
+        self.credentials = credentials
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._scheduled_expiry: Optional[datetime] = None
+
+    def schedule(self) -> None:
+        """Schedule a refresh for the current token unless already scheduled."""
+        expiry = getattr(self.credentials, "expiry", None)
+        if expiry is None or expiry == self._scheduled_expiry:
+            return
+
+        with self._lock:
+            if expiry == self._scheduled_expiry:
+                return
+
+            # google-auth stores expiry as a naive UTC datetime
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            remaining = (expiry - now).total_seconds()
+            if remaining <= 0:
+                return
+
+            # Jitter keeps processes that started together from refreshing
+            # at the same instant
+            fraction = REFRESH_LIFETIME_FRACTION - random.uniform(
+                0, REFRESH_JITTER_FRACTION
+            )
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(remaining * fraction, self._refresh)
+            self._timer.daemon = True
+            self._timer.start()
+            self._scheduled_expiry = expiry
+
+    def cancel(self) -> None:
+        """Cancel any pending refresh."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _refresh(self) -> None:
+        """Refresh the credentials once.
+
+        The next refresh is scheduled by the next request that uses the new
+        token, not from here, so an idle session stops refreshing.
+        """
+        with self._lock:
+            self._timer = None
+        try:
+            self.credentials.refresh(google.auth.transport.requests.Request())
+        except google.auth.exceptions.GoogleAuthError:
+            # Leave it to the inline refresh on the next request
+            pass
+
+
+class _RefreshAheadSession(google.auth.transport.requests.AuthorizedSession):
+    """Authorized session that refreshes its token ahead of expiry."""
+
+    def __init__(self, credentials: Credentials, **kwargs):
+        super().__init__(credentials, **kwargs)
+        self._refresher = _TokenRefresher(credentials)
+        # Cancel a pending refresh once the session is garbage-collected
+        weakref.finalize(self, self._refresher.cancel)
+
+    def request(self, method, url, *args, **kwargs):
+        """Send a request and schedule a refresh for the token it used."""
+        response = super().request(method, url, *args, **kwargs)
+        self._refresher.schedule()
+        return response
+
+    def close(self):
+        """Close the session and cancel any pending token refresh."""
+        self._refresher.cancel()
+        super().close()
+
+
+def _credentials_key(
+    credentials: Credentials, service_account_info: Optional[Dict[str, Any]] = None
+) -> Tuple[Any, ...]:
+    """Get a key identifying credentials that authenticate as the same principal.
+
+    Credentials built from service account key data are identified by the
+    key's email, key ID, token URI and universe domain, so separately loaded
+    copies of the same key share a session. Other credentials may carry a
+    delegated subject or extra claims that google-auth does not expose, so
+    they are keyed by identity.
+    """
+    if service_account_info is not None:
+        return (
+            "service_account",
+            service_account_info.get("client_email"),
+            service_account_info.get("private_key_id"),
+            service_account_info.get("token_uri"),
+            service_account_info.get("universe_domain"),
+            service_account_info.get("quota_project_id"),
+        )
+    return (type(credentials), id(credentials))
+
+
+def _get_shared_session(
+    credentials: Credentials,
+    scopes: List[str],
+    pool_connections: int,
+    pool_maxsize: int,
+    service_account_info: Optional[Dict[str, Any]] = None,
+) -> google.auth.transport.requests.AuthorizedSession:
+    """Get the authorized session shared by all users of equivalent credentials.
+
+    Sessions are shared process-wide, so every client authenticating as the
+    same principal with the same scopes reuses one connection pool. Callers
+    must hold _SESSION_LOCK.
+    """
+    key = (
+        _credentials_key(credentials, service_account_info),
+        tuple(sorted(scopes)),
+        pool_connections,
+        pool_maxsize,
+    )
+    session = _SHARED_SESSIONS.get(key)
+    if session is None:
+        session = _RefreshAheadSession(credentials)
+        session.mount("https://", _create_adapter(pool_connections, pool_maxsize))
+        # Set custom user agent
+        session.headers["User-Agent"] = "secops-wrapper-sdk"
+        _SHARED_SESSIONS[key] = session
+    return session
+
 
 class SecOpsAuth:
-    """Handles authentication for the Google SecOps SDK."""
+    """Handles authentication for the Google SecOps SDK.
+
+    Authorized sessions are shared process-wide by every instance with
+    equivalent credentials, scopes and pool settings, so changes made to a
+    session (headers, proxies, verify, close()) apply to all of them.
+    Instances given a credentials object always get a session of their own.
+    """
 
     def __init__(
         self,
@@ -33,6 +254,8 @@ class SecOpsAuth:
         service_account_path: Optional[str] = None,
         service_account_info: Optional[Dict[str, Any]] = None,
         scopes: Optional[List[str]] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
     ):
         """Initialize authentication for SecOps.
 
@@ -41,13 +264,31 @@ class SecOpsAuth:
             service_account_path: Optional path to service account JSON key file
             service_account_info: Optional service account JSON key data as dict
             scopes: Optional list of OAuth scopes to request
+            pool_connections: Number of host connection pools to cache
+            pool_maxsize: Maximum number of connections kept per pool
         """
         self.scopes = scopes or CHRONICLE_SCOPES
-        self.credentials = self._get_credentials(
-            credentials, service_account_path, service_account_info
-        )
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        # Credentials are resolved on first use to avoid eager I/O
+        self._cred_args = (credentials, service_account_path, service_account_info)
+        self._credentials = None
         self._session = None
 
+    @property
+    def credentials(self) -> Credentials:
+        """Get the credentials, resolving them on first access.
+
+        Returns:
+            Google Auth credentials scoped for SecOps
+
+        Raises:
+            AuthenticationError: If credentials cannot be loaded
+        """
+        if self._credentials is None:
+            self._credentials = self._get_credentials(*self._cred_args)
+        return self._credentials
+
     def _get_credentials(
         self,
         credentials: Optional[Credentials],
@@ -65,13 +306,10 @@ class SecOpsAuth:
                 )
 
             if service_account_path:
-                return service_account.Credentials.from_service_account_file(
-                    service_account_path, scopes=self.scopes
-                )
+                return _load_sa_file(service_account_path, tuple(self.scopes))
 
             # Try to get default credentials
-            credentials, project = google.auth.default(scopes=self.scopes)
-            return credentials
+            return _load_default_credentials(tuple(self.scopes))
         except Exception as e:
             raise AuthenticationError(f"Failed to get credentials: {str(e)}")
 
@@ -79,13 +317,22 @@ class SecOpsAuth:
     def session(self):
         """Get an authorized session using the credentials.
 
+        The session may be shared with other SecOpsAuth instances; see the
+        class docstring.
+
         Returns:
             Authorized session for API requests
         """
         if self._session is None:
-            self._session = google.auth.transport.requests.AuthorizedSession(
-                self.credentials
-            )
-            # Set custom user agent
-            self._session.headers["User-Agent"] = "secops-wrapper-sdk"
+            passed_credentials, _, service_account_info = self._cred_args
+            with _SESSION_LOCK:
+                self._session = _get_shared_session(
+                    self.credentials,
+                    self.scopes,
+                    self.pool_connections,
+                    self.pool_maxsize,
+                    # Key data only describes the credentials when it was
+                    # used to build them
+                    service_account_info if passed_credentials is None else None,
+                )
         return self._session
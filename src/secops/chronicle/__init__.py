@@ -29,9 +29,11 @@ from secops.chronicle.log_ingest import (
     create_forwarder,
     get_or_create_forwarder,
     list_forwarders,
+    iter_forwarders,
     get_forwarder,
     extract_forwarder_id,
 )
+from secops.chronicle.log_ingest_async import aingest_log, aingest_udm
 from secops.chronicle.log_types import (
     LogType,
     get_all_log_types,
@@ -124,8 +126,11 @@ __all__ = [
     "create_forwarder",
     "get_or_create_forwarder",
     "list_forwarders",
+    "iter_forwarders",
     "get_forwarder",
     "extract_forwarder_id",
+    "aingest_log",
+    "aingest_udm",
     # Log Types
     "LogType",
     "get_all_log_types",
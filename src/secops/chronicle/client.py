@@ -38,6 +38,11 @@ from secops.chronicle.log_ingest import (
     get_or_create_forwarder as _get_or_create_forwarder,
     ingest_udm as _ingest_udm,
 )
+from secops.chronicle.log_ingest_async import (
+    aingest_log as _aingest_log,
+    aingest_udm as _aingest_udm,
+    close_async_client as _close_async_client,
+)
 from secops.chronicle.log_types import (
     get_all_log_types as _get_all_log_types,
     is_valid_log_type as _is_valid_log_type,
@@ -227,7 +232,12 @@ class ChronicleClient:
         self.customer_id = customer_id
         self.region = region
         self._default_forwarder_display_name: str = "Wrapper-SDK-Forwarder"
-        self._cached_default_forwarder_id: Optional[str] = None
+        # Maps forwarder display name to (forwarder ID, monotonic cache time)
+        self._forwarder_id_cache: Dict[str, Tuple[str, float]] = {}
+        # HTTP/2 client for async ingestion and the event loop it is bound to,
+        # created on first use
+        self._async_http_client = None
+        self._async_http_loop = None
 
         # Format the instance ID to match the expected format
         if region in ["dev", "staging"]:
@@ -276,6 +286,11 @@ class ChronicleClient:
     def session(self) -> google_auth_requests.AuthorizedSession:
         """Get an authenticated session.
 
+        The session is shared process-wide by every client authenticating
+        as the same principal with the same scopes and pool settings.
+        Changing its headers, proxies or TLS settings, or closing it,
+        affects all of those clients.
+
         Returns:
             Authorized session for API requests
         """
@@ -1451,6 +1466,7 @@ class ChronicleClient:
         force_log_type: bool = False,
         namespace: Optional[str] = None,
         labels: Optional[Dict[str, str]] = None,
+        batch_size: int = 1000,
     ) -> Dict[str, Any]:
         """Ingest a log into Chronicle.
 
@@ -1461,13 +1477,21 @@ class ChronicleClient:
             collection_time: The time the log was collected (defaults to current time)
             forwarder_id: ID of the forwarder to use (creates or uses default if None)
             force_log_type: Whether to force using the log type even if not in the valid list
+            batch_size: Maximum number of logs to send in a single request
 
         Returns:
-            Dictionary containing the operation details for the ingestion
+            Dictionary containing the operation details for the ingestion. If
+            more than batch_size logs are given, they are sent in several
+            requests and a dictionary with a "batches" list holding the
+            response of each request is returned instead.
 
         Raises:
-            ValueError: If the log type is invalid or timestamps are invalid
+            ValueError: If the log type, timestamps or batch size are invalid,
+                or no log messages are provided
             APIError: If the API request fails
+            BatchIngestError: If a batch fails after earlier batches were
+                ingested. Later batches are not sent; the error's responses
+                hold the ingested batches so a retry can skip them.
         """
         return _ingest_log(
             self,
@@ -1479,6 +1503,7 @@ class ChronicleClient:
             force_log_type=force_log_type,
             namespace=namespace,
             labels=labels,
+            batch_size=batch_size,
         )
 
     def get_or_create_forwarder(
@@ -1549,12 +1574,102 @@ class ChronicleClient:
         self,
         udm_events: Union[Dict[str, Any], List[Dict[str, Any]]],
         add_missing_ids: bool = True,
+        max_workers: int = 1,
     ) -> Dict[str, Any]:
         """Ingest UDM events directly into Chronicle.
 
         Args:
             udm_events: A single UDM event dictionary or a list of UDM event dictionaries
             add_missing_ids: Whether to automatically add unique IDs to events missing them
+            max_workers: Number of concurrent requests to split the events across
+
+        Returns:
+            Dictionary containing the operation details for the ingestion
+
+        Raises:
+            ValueError: If any required fields are missing or events are malformed
+            APIError: If the API request fails
+            BatchIngestError: If some chunks fail while others are ingested;
+                its responses and errors hold the outcome of each chunk
+        """
+        return _ingest_udm(
+            self,
+            udm_events=udm_events,
+            add_missing_ids=add_missing_ids,
+            max_workers=max_workers,
+        )
+
+    async def aingest_log(
+        self,
+        log_type: str,
+        log_message: Union[str, bytes, List[Union[str, bytes]]],
+        log_entry_time: Optional[datetime] = None,
+        collection_time: Optional[datetime] = None,
+        forwarder_id: Optional[str] = None,
+        force_log_type: bool = False,
+        namespace: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+        batch_size: int = 1000,
+        max_concurrency: int = 1,
+    ) -> Dict[str, Any]:
+        """Ingest logs into Chronicle asynchronously over HTTP/2.
+
+        Requires the optional httpx dependency (pip install "secops[async]").
+
+        Args:
+            log_type: Chronicle log type (e.g., "OKTA", "WINDOWS", etc.)
+            log_message: A single log message or a list of log messages
+            log_entry_time: The time the log entry was created (defaults to current time)
+            collection_time: The time the log was collected (defaults to current time)
+            forwarder_id: ID of the forwarder to use (creates or uses default if None)
+            force_log_type: Whether to force using the log type even if not in the valid list
+            namespace: The environment namespace to tag the logs with
+            labels: Dictionary of custom metadata labels to attach to the log entries
+            batch_size: Maximum number of logs to send in a single request
+            max_concurrency: Maximum number of batches to send concurrently
+
+        Returns:
+            Dictionary containing the operation details for the ingestion. If
+            more than batch_size logs are given, they are sent in several
+            requests and a dictionary with a "batches" list holding the
+            response of each request is returned instead.
+
+        Raises:
+            ValueError: If the log type, timestamps or batch size are invalid,
+                or no log messages are provided
+            APIError: If the API request fails
+            BatchIngestError: If a batch fails after other batches were
+                ingested; no new batches are sent after a failure
+            SecOpsError: If httpx is not installed
+        """
+        return await _aingest_log(
+            self,
+            log_type=log_type,
+            log_message=log_message,
+            log_entry_time=log_entry_time,
+            collection_time=collection_time,
+            forwarder_id=forwarder_id,
+            force_log_type=force_log_type,
+            namespace=namespace,
+            labels=labels,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+        )
+
+    async def aingest_udm(
+        self,
+        udm_events: Union[Dict[str, Any], List[Dict[str, Any]]],
+        add_missing_ids: bool = True,
+        max_concurrency: int = 1,
+    ) -> Dict[str, Any]:
+        """Ingest UDM events directly into Chronicle asynchronously over HTTP/2.
+
+        Requires the optional httpx dependency (pip install "secops[async]").
+
+        Args:
+            udm_events: A single UDM event dictionary or a list of UDM event dictionaries
+            add_missing_ids: Whether to automatically add unique IDs to events missing them
+            max_concurrency: Number of concurrent requests to split the events across
 
         Returns:
             Dictionary containing the operation details for the ingestion
@@ -1562,8 +1677,19 @@ class ChronicleClient:
         Raises:
             ValueError: If any required fields are missing or events are malformed
             APIError: If the API request fails
+            BatchIngestError: If some chunks fail while others are ingested
+            SecOpsError: If httpx is not installed
         """
-        return _ingest_udm(self, udm_events=udm_events, add_missing_ids=add_missing_ids)
+        return await _aingest_udm(
+            self,
+            udm_events=udm_events,
+            add_missing_ids=add_missing_ids,
+            max_concurrency=max_concurrency,
+        )
+
+    async def aclose(self) -> None:
+        """Close the HTTP/2 connection used by async ingestion, if any."""
+        await _close_async_client(self)
 
     def get_data_export(self, data_export_id: str) -> Dict[str, Any]:
         """Get information about a specific data export.
@@ -15,18 +15,70 @@
 """Chronicle log ingestion functionality."""
 
 import base64
-import uuid
-import copy
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Union
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 
-from secops.exceptions import APIError
+import requests
+
+from secops.exceptions import APIError, BatchIngestError
 from secops.chronicle.log_types import is_valid_log_type
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Forward declaration for type hinting to avoid circular import
 if False:
     from secops.chronicle.client import ChronicleClient
 
+# Seconds a forwarder ID stays cached per display name
+FORWARDER_CACHE_TTL = 15 * 60
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Sentinel for distinguishing absent keys from keys set to None
+_MISSING = object()
+
+# Bit masks setting the RFC 4122 version (4) and variant on a 128-bit integer
+_UUID4_CLEAR_MASK = ~((0xF000 << 64) | (0xC000 << 48))
+_UUID4_SET_BITS = (0x4000 << 64) | (0x8000 << 48)
+
+
+def _reject_unserializable(obj: Any) -> Any:
+    """orjson default hook raising the same error as the json module."""
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _serialize_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request payload to JSON bytes.
+
+    Uses orjson when it is installed, which is considerably faster than the
+    standard library for large ingestion batches. Datetimes and dataclasses
+    are rejected with TypeError on both paths, as requests' json= did.
+
+    The paths still differ for NaN and Infinity, which the standard library
+    rejects with ValueError while orjson writes them as null, and for UUID
+    and enum values, which only orjson serializes.
+
+    Raises:
+        TypeError: If the payload contains a value that is not JSON serializable
+        ValueError: If the payload contains NaN or Infinity (standard library only)
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            payload,
+            default=_reject_unserializable,
+            option=orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+    return json.dumps(payload, allow_nan=False).encode("utf-8")
+
 
 def create_forwarder(
     client: "ChronicleClient",
@@ -75,18 +127,18 @@ def create_forwarder(
     return response.json()
 
 
-def list_forwarders(
+def iter_forwarders(
     client: "ChronicleClient", page_size: int = 50, page_token: Optional[str] = None
-) -> Dict[str, Any]:
-    """List forwarders in Chronicle.
+) -> Iterator[Dict[str, Any]]:
+    """Iterate over forwarders in Chronicle, fetching pages lazily.
 
     Args:
         client: ChronicleClient instance
-        page_size: Maximum number of forwarders to return (1-1000)
-        page_token: Token for pagination
+        page_size: Maximum number of forwarders to request per page (1-1000)
+        page_token: Token of the page to start from
 
-    Returns:
-        Dictionary containing list of forwarders and next page token
+    Yields:
+        Dictionary containing the details of each forwarder
 
     Raises:
         APIError: If the API request fails
@@ -100,25 +152,43 @@ def list_forwarders(
     if page_token:
         params["pageToken"] = page_token
 
-    # Send the request
-    response = client.session.get(url, params=params)
+    while True:
+        # Send the request
+        response = client.session.get(url, params=params)
 
-    # Check for errors
-    if response.status_code != 200:
-        raise APIError(f"Failed to list forwarders: {response.text}")
+        # Check for errors
+        if response.status_code != 200:
+            raise APIError(f"Failed to list forwarders: {response.text}")
+
+        result = response.json()
+        yield from result.get("forwarders", [])
 
-    result = response.json()
+        next_page_token = result.get("nextPageToken")
+        if next_page_token:
+            params["pageToken"] = next_page_token
+        else:
+            break
 
-    # If there's a next page token, fetch additional pages and combine results
-    if "nextPageToken" in result and result["nextPageToken"]:
-        next_page = list_forwarders(client, page_size, result["nextPageToken"])
-        if "forwarders" in next_page and next_page["forwarders"]:
-            # Combine the forwarders from both pages
-            result["forwarders"].extend(next_page["forwarders"])
-        # Remove the nextPageToken since we've fetched all pages
-        result.pop("nextPageToken")
 
-    return result
+def list_forwarders(
+    client: "ChronicleClient", page_size: int = 50, page_token: Optional[str] = None
+) -> Dict[str, Any]:
+    """List forwarders in Chronicle.
+
+    All pages from page_token onwards are fetched and combined.
+
+    Args:
+        client: ChronicleClient instance
+        page_size: Maximum number of forwarders to request per page (1-1000)
+        page_token: Token for pagination
+
+    Returns:
+        Dictionary containing list of forwarders
+
+    Raises:
+        APIError: If the API request fails
+    """
+    return {"forwarders": list(iter_forwarders(client, page_size, page_token))}
 
 
 def get_forwarder(client: "ChronicleClient", forwarder_id: str) -> Dict[str, Any]:
@@ -151,7 +221,7 @@ def _find_forwarder_by_display_name(
 ) -> Optional[Dict[str, Any]]:
     """Find an existing forwarder by its display name.
 
-    This function calls list_forwarders which handles pagination to get all forwarders.
+    Forwarders are scanned page by page, stopping at the first match.
 
     Args:
         client: ChronicleClient instance.
@@ -164,10 +234,9 @@ def _find_forwarder_by_display_name(
         APIError: If the API request to list forwarders fails.
     """
     try:
-        # list_forwarders internally handles pagination to get all forwarders
-        # when no page_token is supplied initially.
-        forwarders_response = list_forwarders(client, page_size=1000)
-        for forwarder in forwarders_response.get("forwarders", []):
+        # Pages are fetched lazily, so no further pages are requested
+        # once a match is found
+        for forwarder in iter_forwarders(client, page_size=1000):
             if forwarder.get("displayName") == display_name:
                 return forwarder
         return None
@@ -181,8 +250,9 @@ def get_or_create_forwarder(
 ) -> Dict[str, Any]:
     """Get an existing forwarder by name or create a new one if none exists.
 
-    This function now includes caching for the default forwarder to reduce
-    API calls to list_forwarders.
+    Forwarder IDs are cached per display name for FORWARDER_CACHE_TTL seconds
+    to avoid listing all forwarders on every call. A cached ID is still
+    validated with get_forwarder before it is used.
 
     Args:
         client: ChronicleClient instance.
@@ -196,39 +266,37 @@ def get_or_create_forwarder(
         APIError: If the API request fails.
     """
     target_display_name = display_name or client._default_forwarder_display_name
-    is_default_forwarder_request = (target_display_name == client._default_forwarder_display_name)
-
-    if is_default_forwarder_request and client._cached_default_forwarder_id:
-        try:
-            # Attempt to get the cached default forwarder directly
-            forwarder = get_forwarder(client, client._cached_default_forwarder_id)
-            if forwarder.get("displayName") == client._default_forwarder_display_name:
-                return forwarder  # Cache hit and valid
-            else:
-                # Cached ID points to a forwarder with a different name (unexpected)
-                # or forwarder was modified. Invalidate cache.
-                client._cached_default_forwarder_id = None
-        except APIError:
-            # Forwarder might have been deleted or permissions changed. Invalidate cache.
-            client._cached_default_forwarder_id = None
-            # Proceed to find/create logic
+    cache = client._forwarder_id_cache
+
+    cached = cache.get(target_display_name)
+    if cached:
+        cached_id, cached_at = cached
+        if time.monotonic() - cached_at < FORWARDER_CACHE_TTL:
+            try:
+                # Attempt to get the cached forwarder directly
+                forwarder = get_forwarder(client, cached_id)
+                if forwarder.get("displayName") == target_display_name:
+                    return forwarder  # Cache hit and valid
+            except APIError:
+                # Forwarder might have been deleted or permissions changed.
+                # Proceed to find/create logic
+                pass
+        # Cached entry expired, or the forwarder was removed or renamed
+        cache.pop(target_display_name, None)
 
     try:
         # Try to find the forwarder by its display name
-        found_forwarder = _find_forwarder_by_display_name(client, target_display_name)
+        forwarder = _find_forwarder_by_display_name(client, target_display_name)
 
-        if found_forwarder:
-            if is_default_forwarder_request:
-                # Cache the ID of the default forwarder if found
-                client._cached_default_forwarder_id = extract_forwarder_id(found_forwarder["name"])
-            return found_forwarder
+        if not forwarder:
+            # No matching forwarder found, create a new one
+            forwarder = create_forwarder(client, display_name=target_display_name)
 
-        # No matching forwarder found, create a new one
-        created_forwarder = create_forwarder(client, display_name=target_display_name)
-        if is_default_forwarder_request:
-            # Cache the ID of the newly created default forwarder
-            client._cached_default_forwarder_id = extract_forwarder_id(created_forwarder["name"])
-        return created_forwarder
+        cache[target_display_name] = (
+            extract_forwarder_id(forwarder["name"]),
+            time.monotonic(),
+        )
+        return forwarder
 
     except APIError as e:
         if "permission" in str(e).lower():
@@ -236,6 +304,29 @@ def get_or_create_forwarder(
         raise e
 
 
+def _new_event_id() -> str:
+    """Generate a random UUID4 string for a UDM event ID.
+
+    Produces the same dashed form as str(uuid.uuid4()) without building a
+    UUID object, which is measurably cheaper for large event batches.
+    """
+    value = int.from_bytes(os.urandom(16), "big") & _UUID4_CLEAR_MASK | _UUID4_SET_BITS
+    h = f"{value:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _format_timestamp(dt: datetime) -> str:
+    """Format a datetime as an RFC 3339 timestamp with a "Z" suffix.
+
+    Equivalent to dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ") without the cost of
+    strftime. The datetime is expected to already be in UTC.
+    """
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T"
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{dt.microsecond:06d}Z"
+    )
+
+
 def extract_forwarder_id(forwarder_name: str) -> str:
     """Extract the forwarder ID from a full forwarder name.
 
@@ -259,34 +350,34 @@ def extract_forwarder_id(forwarder_name: str) -> str:
         # Validate that it looks like a UUID or a simple string identifier
         return forwarder_name
 
-    segments = forwarder_name.split("/")
-    # Filter out empty segments (handles cases like "/")
-    segments = [s for s in segments if s]
+    # Take the last non-empty segment, ignoring any trailing slashes
+    forwarder_id = forwarder_name.rstrip("/").rpartition("/")[2]
 
-    if not segments:
+    if not forwarder_id:
         raise ValueError(f"Invalid forwarder name format: {forwarder_name}")
 
-    # Return the last segment of the path
-    return segments[-1]
+    return forwarder_id
 
 
 def ingest_log(
     client: "ChronicleClient",
     log_type: str,
-    log_message: Union[str, List[str]],
+    log_message: Union[str, bytes, List[Union[str, bytes]]],
     log_entry_time: Optional[datetime] = None,
     collection_time: Optional[datetime] = None,
     namespace: Optional[str] = None,
     labels: Optional[Dict[str, str]] = None,
     forwarder_id: Optional[str] = None,
     force_log_type: bool = False,
+    batch_size: int = 1000,
 ) -> Dict[str, Any]:
     """Ingest one or more logs into Chronicle.
 
     Args:
         client: ChronicleClient instance
         log_type: Chronicle log type (e.g., "OKTA", "WINDOWS", etc.)
-        log_message: Either a single log message string or a list of log message strings
+        log_message: Either a single log message or a list of log messages. Messages
+            may be strings or UTF-8 encoded bytes.
         log_entry_time: The time the log entry was created (defaults to current time)
         collection_time: The time the log was collected (defaults to current time)
         namespace: The user-configured environment namespace to identify the data domain
@@ -295,16 +386,90 @@ def ingest_log(
         labels: Dictionary of custom metadata labels to attach to the log entries.
         forwarder_id: ID of the forwarder to use (creates or uses default if None)
         force_log_type: Whether to force using the log type even if not in the valid list
+        batch_size: Maximum number of logs to send in a single request
 
     Returns:
-        Dictionary containing the operation details for the ingestion
+        Dictionary containing the operation details for the ingestion. If the
+        logs were sent in more than one request, a dictionary with a "batches"
+        list holding the response of each request.
 
     Raises:
-        ValueError: If the log type is invalid or timestamps are invalid
+        ValueError: If the log type, timestamps or batch size are invalid, or no
+            log messages are provided
         APIError: If the API request fails
+        BatchIngestError: If a batch fails after earlier batches were ingested.
+            Batches are sent in order and sending stops at the failed batch;
+            the error's responses hold the ingested batches, so a retry can
+            resume from the failed batch instead of re-ingesting them.
+    """
+    url, payloads = _prepare_log_import(
+        client,
+        log_type=log_type,
+        log_message=log_message,
+        log_entry_time=log_entry_time,
+        collection_time=collection_time,
+        namespace=namespace,
+        labels=labels,
+        forwarder_id=forwarder_id,
+        force_log_type=force_log_type,
+        batch_size=batch_size,
+    )
+
+    # Batches are posted sequentially, so only one is held in memory at a
+    # time, and reuse the session's connections
+    responses: List[Dict[str, Any]] = []
+    for index, payload in enumerate(payloads):
+        try:
+            response = client.session.post(
+                url, data=_serialize_payload(payload), headers=JSON_HEADERS
+            )
+            responses.append(_parse_log_import_response(response))
+        except (APIError, requests.RequestException) as e:
+            if not responses:
+                raise
+            raise BatchIngestError(
+                f"Failed to ingest log batch {index} after {index} batches were "
+                f"ingested; later batches were not sent: {str(e)}",
+                responses=dict(enumerate(responses)),
+                errors={index: e},
+            ) from e
+    return _combine_batch_responses(responses)
+
+
+def _prepare_log_import(
+    client: "ChronicleClient",
+    log_type: str,
+    log_message: Union[str, bytes, List[Union[str, bytes]]],
+    log_entry_time: Optional[datetime],
+    collection_time: Optional[datetime],
+    namespace: Optional[str],
+    labels: Optional[Dict[str, str]],
+    forwarder_id: Optional[str],
+    force_log_type: bool,
+    batch_size: int,
+) -> Tuple[str, Iterator[Dict[str, Any]]]:
+    """Validate log ingestion arguments and prepare the import requests.
+
+    Resolves the default forwarder through the API when no forwarder_id is
+    given. See ingest_log for a description of the arguments.
+
+    Returns:
+        Tuple of the import URL and an iterator over the request payloads,
+        one per batch. Payloads are built lazily as the iterator is consumed.
+
+    Raises:
+        ValueError: If the log type, timestamps or batch size are invalid, or no
+            log messages are provided
+        APIError: If resolving the default forwarder fails
     """
-    # Validate log type
-    if not is_valid_log_type(log_type) and not force_log_type:
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+
+    if isinstance(log_message, list) and not log_message:
+        raise ValueError("No log messages provided")
+
+    # Validate log type (skipped entirely when the type is forced)
+    if not force_log_type and not is_valid_log_type(log_type):
         raise ValueError(
             f"Invalid log type: {log_type}. Use force_log_type=True to override."
         )
@@ -325,8 +490,11 @@ def ingest_log(
         raise ValueError("Collection time must be same or after log entry time")
 
     # Format timestamps for API
-    log_entry_time_str = log_entry_time.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-    collection_time_str = collection_time.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    log_entry_time_str = _format_timestamp(log_entry_time)
+    if collection_time is log_entry_time:
+        collection_time_str = log_entry_time_str
+    else:
+        collection_time_str = _format_timestamp(collection_time)
 
     # If forwarder_id is not provided, get or create default forwarder
     if forwarder_id is None:
@@ -345,46 +513,124 @@ def ingest_log(
     # Convert single log message to a list for unified processing
     log_messages = log_message if isinstance(log_message, list) else [log_message]
 
-    # Prepare logs for the payload
-    logs = []
-    for msg in log_messages:
-        # Encode log message in base64
-        log_data = base64.b64encode(msg.encode("utf-8")).decode("utf-8")
-
-        log_data = {
-            "data": log_data,
-            "log_entry_time": log_entry_time_str,
-            "collection_time": collection_time_str,
+    # Fields shared by every log entry are built once for the whole batch
+    common_fields = {
+        "log_entry_time": log_entry_time_str,
+        "collection_time": collection_time_str,
+    }
+    if namespace:
+        common_fields["environment_namespace"] = namespace
+    # Fix for labels: API expects a map where values are LogLabel objects
+    if labels:
+        common_fields["labels"] = {
+            key: {"value": value} for key, value in labels.items()
         }
 
-        if namespace:
-            log_data["environment_namespace"] = namespace
+    return url, _iter_log_payloads(
+        log_messages, common_fields, forwarder_resource, batch_size
+    )
 
-        # Fix for labels: API expects a map where values are LogLabel objects
-        if labels:
-            log_data["labels"] = {
-                key: {"value": value} for key, value in labels.items()
-            }
 
-        logs.append(log_data)
+def _iter_log_payloads(
+    log_messages: List[Union[str, bytes]],
+    common_fields: Dict[str, Any],
+    forwarder_resource: str,
+    batch_size: int,
+) -> Iterator[Dict[str, Any]]:
+    """Build log import payloads of at most batch_size logs each.
 
-    # Construct the request payload
-    payload = {"inline_source": {"logs": logs, "forwarder": forwarder_resource}}
+    Args:
+        log_messages: Log messages to encode
+        common_fields: Fields shared by every log entry
+        forwarder_resource: Full resource name of the forwarder
+        batch_size: Maximum number of logs per payload
 
-    # Send the request
-    response = client.session.post(url, json=payload)
+    Yields:
+        Request payload for each batch of logs
+    """
+    b64encode = base64.b64encode
+    # Every log entry starts as a copy of a template that already holds all
+    # of its keys, so filling in "data" never has to grow the dict
+    log_template = {"data": None, **common_fields}
+    for start in range(0, len(log_messages), batch_size):
+        logs = []
+        add_log = logs.append
+        for msg in log_messages[start : start + batch_size]:
+            # Encode log message in base64. Messages already given as bytes
+            # skip the UTF-8 encode, and base64 output is always ASCII.
+            log = log_template.copy()
+            log["data"] = b64encode(
+                msg if isinstance(msg, bytes) else msg.encode("utf-8")
+            ).decode("ascii")
+            add_log(log)
+
+        yield {"inline_source": {"logs": logs, "forwarder": forwarder_resource}}
+
+
+def _parse_log_import_response(response: Any) -> Dict[str, Any]:
+    """Check a log import response and return its JSON body.
 
-    # Check for errors
+    Args:
+        response: HTTP response from the logs:import endpoint
+
+    Returns:
+        Dictionary containing the operation details for the ingestion
+
+    Raises:
+        APIError: If the API request failed
+    """
     if response.status_code != 200:
         raise APIError(f"Failed to ingest log: {response.text}")
 
     return response.json()
 
 
+def _combine_batch_responses(responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine the responses of batched import requests.
+
+    Args:
+        responses: Response of each import request, in order
+
+    Returns:
+        The only response if a single request was made, otherwise a
+        dictionary with the responses in a "batches" list
+    """
+    if len(responses) == 1:
+        return responses[0]
+    return {"batches": responses}
+
+
+def _raise_for_batch_errors(
+    responses: Dict[int, Dict[str, Any]],
+    errors: Dict[int, Exception],
+    message: str,
+) -> None:
+    """Raise for failed batches of an ingestion split across requests.
+
+    Args:
+        responses: Response of each ingested batch, keyed by batch index
+        errors: Error of each failed batch, keyed by batch index
+        message: Description of the failure, prefixed to the first error
+
+    Raises:
+        APIError: The first batch error, if no batch was ingested
+        BatchIngestError: If some batches failed and others were ingested
+    """
+    if not errors:
+        return
+    first_error = errors[min(errors)]
+    if not responses:
+        raise first_error
+    raise BatchIngestError(
+        f"{message}: {str(first_error)}", responses=responses, errors=errors
+    ) from first_error
+
+
 def ingest_udm(
     client: "ChronicleClient",
     udm_events: Union[Dict[str, Any], List[Dict[str, Any]]],
     add_missing_ids: bool = True,
+    max_workers: int = 1,
 ) -> Dict[str, Any]:
     """Ingest UDM events directly into Chronicle.
 
@@ -392,13 +638,20 @@ def ingest_udm(
         client: ChronicleClient instance
         udm_events: A single UDM event dictionary or a list of UDM event dictionaries
         add_missing_ids: Whether to automatically add unique IDs to events missing them
+        max_workers: Number of concurrent requests to split the events across.
+            The default of 1 sends all events in a single request.
 
     Returns:
-        Dictionary containing the operation details for the ingestion
+        Dictionary containing the operation details for the ingestion. If the
+        events were split across several requests, a dictionary with a
+        "batches" list holding the response of each request.
 
     Raises:
         ValueError: If any required fields are missing or events are malformed
         APIError: If the API request fails
+        BatchIngestError: If some chunks fail while others are ingested.
+            Every chunk is sent before the error is raised; its responses and
+            errors hold the outcome of each chunk, keyed by chunk index.
 
     Example:
         ```python
@@ -439,6 +692,61 @@ def ingest_udm(
         result = chronicle.ingest_udm(events)
         ```
     """
+    prepared_events = _prepare_udm_events(udm_events, add_missing_ids)
+    url = _udm_import_url(client)
+
+    def import_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        response = client.session.post(
+            url, data=_build_udm_import_body(events), headers=JSON_HEADERS
+        )
+        return _parse_udm_import_response(response)
+
+    if max_workers <= 1 or len(prepared_events) == 1:
+        return import_events(prepared_events)
+
+    # Post one chunk per worker concurrently; the requests share the
+    # session's connection pool
+    chunks = _split_events(prepared_events, max_workers)
+    responses: Dict[int, Dict[str, Any]] = {}
+    errors: Dict[int, Exception] = {}
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        futures = {
+            executor.submit(import_events, chunk): index
+            for index, chunk in enumerate(chunks)
+        }
+        # Wait for every chunk, so the outcome of each one is known
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                responses[index] = future.result()
+            except (APIError, requests.RequestException) as e:
+                errors[index] = e
+
+    _raise_for_batch_errors(
+        responses,
+        errors,
+        f"Failed to ingest {len(errors)} of {len(chunks)} UDM event chunks; "
+        "the other chunks were ingested",
+    )
+    return _combine_batch_responses([responses[index] for index in sorted(responses)])
+
+
+def _prepare_udm_events(
+    udm_events: Union[Dict[str, Any], List[Dict[str, Any]]],
+    add_missing_ids: bool,
+) -> List[Dict[str, Any]]:
+    """Validate UDM events and fill in missing timestamps and IDs.
+
+    Args:
+        udm_events: A single UDM event dictionary or a list of UDM event dictionaries
+        add_missing_ids: Whether to add unique IDs to events missing them
+
+    Returns:
+        List of events ready to be imported
+
+    Raises:
+        ValueError: If any required fields are missing or events are malformed
+    """
     # Ensure we have a list of events
     if isinstance(udm_events, dict):
         udm_events = [udm_events]
@@ -446,45 +754,104 @@ def ingest_udm(
     if not udm_events:
         raise ValueError("No UDM events provided")
 
-    # Create deep copies to avoid modifying the original objects
-    events_copy = copy.deepcopy(udm_events)
+    # Process each event: validate and add missing fields. Events needing
+    # changes get a copy of only the event and its metadata, so the
+    # caller's objects are never modified.
+    prepared_events = []
+    # Formatted at most once and shared by all events missing a timestamp
+    current_time_str = None
+    # Local bindings avoid repeated global and attribute lookups per event
+    add_event = prepared_events.append
+    new_event_id = _new_event_id
+    for event in udm_events:
+        metadata = _validate_udm_event(event)
+
+        missing_timestamp = "event_timestamp" not in metadata
+        missing_id = add_missing_ids and "id" not in metadata
+        if missing_timestamp or missing_id:
+            metadata = dict(metadata)
+            event = {**event, "metadata": metadata}
+
+            # Add event timestamp if missing
+            if missing_timestamp:
+                if current_time_str is None:
+                    current_time_str = _format_timestamp(datetime.now(timezone.utc))
+                metadata["event_timestamp"] = current_time_str
+
+            # Add ID if needed
+            if missing_id:
+                metadata["id"] = new_event_id()
+
+        add_event(event)
+
+    return prepared_events
+
+
+def _udm_import_url(client: "ChronicleClient") -> str:
+    """Get the events:import URL for the client's Chronicle instance."""
+    parent = f"projects/{client.project_id}/locations/{client.region}/instances/{client.customer_id}"
+    return f"https://{client.region}-chronicle.googleapis.com/v1alpha/{parent}/events:import"
 
-    # Process each event: validate and add IDs if needed
-    for event in events_copy:
-        # Validate basic structure
-        if not isinstance(event, dict):
-            raise ValueError(
-                f"Invalid UDM event type: {type(event)}. Events must be dictionaries."
-            )
 
-        # Check for required metadata section
-        if "metadata" not in event:
-            raise ValueError("UDM event missing required 'metadata' section")
+def _split_events(
+    events: List[Dict[str, Any]], chunk_count: int
+) -> List[List[Dict[str, Any]]]:
+    """Split events into at most chunk_count contiguous, similarly sized chunks."""
+    chunk_size = (len(events) + chunk_count - 1) // chunk_count
+    return [
+        events[start : start + chunk_size]
+        for start in range(0, len(events), chunk_size)
+    ]
 
-        if not isinstance(event["metadata"], dict):
-            raise ValueError("UDM 'metadata' must be a dictionary")
 
-        # Add event timestamp if missing
-        if "event_timestamp" not in event["metadata"]:
-            current_time = datetime.now().astimezone()
-            event["metadata"]["event_timestamp"] = current_time.isoformat().replace(
-                "+00:00", "Z"
-            )
+def _build_udm_import_body(events: List[Dict[str, Any]]) -> bytes:
+    """Serialize the events:import request body for prepared UDM events."""
+    return _serialize_payload(
+        {"inline_source": {"events": [{"udm": event} for event in events]}}
+    )
 
-        # Add ID if needed
-        if add_missing_ids and "id" not in event["metadata"]:
-            event["metadata"]["id"] = str(uuid.uuid4())
 
-    # Prepare the request
-    parent = f"projects/{client.project_id}/locations/{client.region}/instances/{client.customer_id}"
-    url = f"https://{client.region}-chronicle.googleapis.com/v1alpha/{parent}/events:import"
+def _validate_udm_event(event: Any) -> Dict[str, Any]:
+    """Validate the basic structure of a UDM event.
+
+    Args:
+        event: The UDM event to validate
+
+    Returns:
+        The event's metadata dictionary
+
+    Raises:
+        ValueError: If the event or its metadata section is malformed
+    """
+    # Validate basic structure
+    if not isinstance(event, dict):
+        raise ValueError(
+            f"Invalid UDM event type: {type(event)}. Events must be dictionaries."
+        )
+
+    # Check for required metadata section with a single lookup
+    metadata = event.get("metadata", _MISSING)
+    if metadata is _MISSING:
+        raise ValueError("UDM event missing required 'metadata' section")
+
+    if not isinstance(metadata, dict):
+        raise ValueError("UDM 'metadata' must be a dictionary")
 
-    # Format the request body
-    body = {"inline_source": {"events": [{"udm": event} for event in events_copy]}}
+    return metadata
 
-    # Make the API request
-    response = client.session.post(url, json=body)
 
+def _parse_udm_import_response(response: Any) -> Dict[str, Any]:
+    """Check a UDM import response and return its parsed body.
+
+    Args:
+        response: HTTP response from the events:import endpoint
+
+    Returns:
+        Dictionary containing the operation details for the ingestion
+
+    Raises:
+        APIError: If the API request failed
+    """
     # Check for errors
     if response.status_code >= 400:
         error_message = f"Failed to ingest UDM events: {response.text}"
@@ -0,0 +1,391 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Asynchronous Chronicle log ingestion over HTTP/2.
+
+Requests are sent with a shared httpx.AsyncClient, which multiplexes
+concurrent requests over a single HTTP/2 connection. httpx is an optional
+dependency, installed with the "async" extra.
+"""
+
+import asyncio
+import functools
+import os
+import ssl
+import threading
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+
+import google.auth.transport.requests
+
+from secops.exceptions import APIError, SecOpsError
+from secops.chronicle.log_ingest import (
+    JSON_HEADERS,
+    _build_udm_import_body,
+    _combine_batch_responses,
+    _parse_log_import_response,
+    _parse_udm_import_response,
+    _prepare_log_import,
+    _prepare_udm_events,
+    _raise_for_batch_errors,
+    _serialize_payload,
+    _split_events,
+    _udm_import_url,
+)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Forward declaration for type hinting to avoid circular import
+if False:
+    from secops.chronicle.client import ChronicleClient
+
+
+def _tls_verify() -> Union[bool, ssl.SSLContext]:
+    """Get the TLS verification setting for the HTTP/2 client.
+
+    Honours REQUESTS_CA_BUNDLE (or CURL_CA_BUNDLE) the way the requests
+    session does, so a custom CA bundle applies to async ingestion too.
+
+    Returns:
+        An SSL context trusting the configured CA bundle, or True to use
+        httpx's default verification
+    """
+    ca_bundle = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get(
+        "CURL_CA_BUNDLE"
+    )
+    if not ca_bundle:
+        return True
+    if os.path.isdir(ca_bundle):
+        return ssl.create_default_context(capath=ca_bundle)
+    return ssl.create_default_context(cafile=ca_bundle)
+
+
+def _get_async_http_client(client: "ChronicleClient") -> "httpx.AsyncClient":
+    """Get the client's shared HTTP/2 client, creating it on first use.
+
+    An httpx.AsyncClient is bound to the event loop it was first used on,
+    so a new one is created when called from a different event loop.
+
+    Args:
+        client: ChronicleClient instance
+
+    Returns:
+        The httpx.AsyncClient shared by async calls on the running event loop
+
+    Raises:
+        SecOpsError: If httpx or its HTTP/2 support is not installed
+    """
+    loop = asyncio.get_running_loop()
+    if client._async_http_client is None or client._async_http_loop is not loop:
+        if httpx is None:
+            raise SecOpsError(
+                "Async ingestion requires httpx with HTTP/2 support. "
+                'Install it with: pip install "secops[async]"'
+            )
+        try:
+            client._async_http_client = httpx.AsyncClient(
+                http2=True,
+                headers={"User-Agent": "secops-wrapper-sdk"},
+                # Large imports can take longer than httpx's 5 second default,
+                # so match the requests session, which sets no timeout
+                timeout=None,
+                verify=_tls_verify(),
+            )
+        except ImportError as e:
+            # httpx raises ImportError when the h2 package is missing
+            raise SecOpsError(
+                "Async ingestion requires httpx with HTTP/2 support. "
+                'Install it with: pip install "secops[async]"'
+            ) from e
+        client._async_http_loop = loop
+    return client._async_http_client
+
+
+def _next_log_body(
+    payloads: Iterator[Tuple[int, Dict[str, Any]]], lock: threading.Lock
+) -> Optional[Tuple[int, bytes]]:
+    """Build and serialize the next log import payload.
+
+    Args:
+        payloads: Enumerated payload iterator shared by all workers
+        lock: Lock guarding the payload iterator
+
+    Returns:
+        Tuple of the payload's index and its serialized body, or None once
+        the iterator is exhausted
+    """
+    with lock:
+        item = next(payloads, None)
+    if item is None:
+        return None
+    index, payload = item
+    return index, _serialize_payload(payload)
+
+
+async def _auth_headers(client: "ChronicleClient", url: str) -> Dict[str, str]:
+    """Build request headers carrying the client's current access token.
+
+    Args:
+        client: ChronicleClient instance
+        url: URL the headers will be sent to
+
+    Returns:
+        JSON request headers including the Authorization header
+
+    Raises:
+        SecOpsError: If the client's session has no Google credentials
+    """
+    credentials = getattr(client.session, "credentials", None)
+    if credentials is None:
+        raise SecOpsError("Async ingestion requires a session with Google credentials")
+
+    headers = dict(JSON_HEADERS)
+    # before_request refreshes an expired token with a blocking call, so
+    # run it off the event loop
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        None,
+        credentials.before_request,
+        google.auth.transport.requests.Request(),
+        "POST",
+        url,
+        headers,
+    )
+    return headers
+
+
+async def _post(
+    client: "ChronicleClient",
+    http_client: "httpx.AsyncClient",
+    url: str,
+    content: bytes,
+    error_message: str,
+) -> "httpx.Response":
+    """Send an authorized POST request over the HTTP/2 client.
+
+    Headers are built for each request, so long multi-batch runs pick up
+    refreshed tokens.
+
+    Args:
+        client: ChronicleClient instance
+        http_client: The shared httpx.AsyncClient
+        url: URL to post to
+        content: Serialized JSON request body
+        error_message: Prefix for the APIError raised on transport errors
+
+    Returns:
+        The HTTP response
+
+    Raises:
+        APIError: If the request could not be sent or no response was received
+    """
+    headers = await _auth_headers(client, url)
+    try:
+        return await http_client.post(url, content=content, headers=headers)
+    except httpx.HTTPError as e:
+        raise APIError(f"{error_message}: {str(e)}") from e
+
+
+async def close_async_client(client: "ChronicleClient") -> None:
+    """Close the client's shared HTTP/2 client if one was created.
+
+    Args:
+        client: ChronicleClient instance
+    """
+    if client._async_http_client is not None:
+        # A client bound to another event loop cannot be closed from this one
+        if client._async_http_loop is asyncio.get_running_loop():
+            await client._async_http_client.aclose()
+        client._async_http_client = None
+        client._async_http_loop = None
+
+
+async def aingest_log(
+    client: "ChronicleClient",
+    log_type: str,
+    log_message: Union[str, bytes, List[Union[str, bytes]]],
+    log_entry_time: Optional[datetime] = None,
+    collection_time: Optional[datetime] = None,
+    namespace: Optional[str] = None,
+    labels: Optional[Dict[str, str]] = None,
+    forwarder_id: Optional[str] = None,
+    force_log_type: bool = False,
+    batch_size: int = 1000,
+    max_concurrency: int = 1,
+) -> Dict[str, Any]:
+    """Ingest one or more logs into Chronicle asynchronously.
+
+    Accepts the same arguments as ingest_log. Each batch is built and
+    serialized only when a request slot is free, so at most max_concurrency
+    payloads are held in memory at once.
+
+    Args:
+        client: ChronicleClient instance
+        log_type: Chronicle log type (e.g., "OKTA", "WINDOWS", etc.)
+        log_message: Either a single log message or a list of log messages. Messages
+            may be strings or UTF-8 encoded bytes.
+        log_entry_time: The time the log entry was created (defaults to current time)
+        collection_time: The time the log was collected (defaults to current time)
+        namespace: The user-configured environment namespace to identify the data domain
+            the logs originated from.
+        labels: Dictionary of custom metadata labels to attach to the log entries.
+        forwarder_id: ID of the forwarder to use (creates or uses default if None)
+        force_log_type: Whether to force using the log type even if not in the valid list
+        batch_size: Maximum number of logs to send in a single request
+        max_concurrency: Maximum number of batches to send concurrently over
+            the shared HTTP/2 connection
+
+    Returns:
+        Dictionary containing the operation details for the ingestion. If the
+        logs were sent in more than one request, a dictionary with a "batches"
+        list holding the response of each request.
+
+    Raises:
+        ValueError: If the log type, timestamps or batch size are invalid, or no
+            log messages are provided
+        APIError: If the API request fails or cannot be sent
+        BatchIngestError: If a batch fails after other batches were ingested.
+            No new batches are sent after a failure; the error's responses
+            and errors hold the outcome of each batch that was sent.
+        SecOpsError: If httpx is not installed
+    """
+    http_client = _get_async_http_client(client)
+
+    # Resolving the default forwarder may call the API through the
+    # synchronous session, so run it off the event loop
+    loop = asyncio.get_running_loop()
+    url, payloads = await loop.run_in_executor(
+        None,
+        functools.partial(
+            _prepare_log_import,
+            client,
+            log_type=log_type,
+            log_message=log_message,
+            log_entry_time=log_entry_time,
+            collection_time=collection_time,
+            namespace=namespace,
+            labels=labels,
+            forwarder_id=forwarder_id,
+            force_log_type=force_log_type,
+            batch_size=batch_size,
+        ),
+    )
+
+    indexed_payloads = enumerate(payloads)
+    payloads_lock = threading.Lock()
+    results: Dict[int, Dict[str, Any]] = {}
+    errors: Dict[int, Exception] = {}
+
+    async def send_batches() -> None:
+        # Stop taking new batches once one fails; batches already in flight
+        # finish so their outcome is known
+        while not errors:
+            # Build and serialize off the event loop, one batch at a time
+            item = await loop.run_in_executor(
+                None, _next_log_body, indexed_payloads, payloads_lock
+            )
+            if item is None:
+                return
+            index, body = item
+            try:
+                response = await _post(
+                    client, http_client, url, body, "Failed to ingest log"
+                )
+                results[index] = _parse_log_import_response(response)
+            except APIError as e:
+                errors[index] = e
+
+    workers = [
+        asyncio.ensure_future(send_batches()) for _ in range(max(1, max_concurrency))
+    ]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for worker in workers:
+            worker.cancel()
+        raise
+
+    _raise_for_batch_errors(
+        results,
+        errors,
+        f"Failed to ingest {len(errors)} log batches after {len(results)} "
+        "batches were ingested; remaining batches were not sent",
+    )
+    return _combine_batch_responses([results[index] for index in sorted(results)])
+
+
+async def aingest_udm(
+    client: "ChronicleClient",
+    udm_events: Union[Dict[str, Any], List[Dict[str, Any]]],
+    add_missing_ids: bool = True,
+    max_concurrency: int = 1,
+) -> Dict[str, Any]:
+    """Ingest UDM events directly into Chronicle asynchronously.
+
+    Args:
+        client: ChronicleClient instance
+        udm_events: A single UDM event dictionary or a list of UDM event dictionaries
+        add_missing_ids: Whether to automatically add unique IDs to events missing them
+        max_concurrency: Number of concurrent requests to split the events across.
+            The default of 1 sends all events in a single request.
+
+    Returns:
+        Dictionary containing the operation details for the ingestion. If the
+        events were split across several requests, a dictionary with a
+        "batches" list holding the response of each request.
+
+    Raises:
+        ValueError: If any required fields are missing or events are malformed
+        APIError: If the API request fails or cannot be sent
+        BatchIngestError: If some chunks fail while others are ingested; its
+            responses and errors hold the outcome of each chunk
+        SecOpsError: If httpx is not installed
+    """
+    http_client = _get_async_http_client(client)
+    prepared_events = _prepare_udm_events(udm_events, add_missing_ids)
+    url = _udm_import_url(client)
+    loop = asyncio.get_running_loop()
+
+    async def send_chunk(chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+        body = await loop.run_in_executor(None, _build_udm_import_body, chunk)
+        response = await _post(
+            client, http_client, url, body, "Failed to ingest UDM events"
+        )
+        return _parse_udm_import_response(response)
+
+    chunks = _split_events(prepared_events, max(1, max_concurrency))
+    # Every chunk is sent to completion so the outcome of each one is known
+    outcomes = await asyncio.gather(
+        *(send_chunk(chunk) for chunk in chunks), return_exceptions=True
+    )
+    responses: Dict[int, Dict[str, Any]] = {}
+    errors: Dict[int, Exception] = {}
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, APIError):
+            errors[index] = outcome
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            responses[index] = outcome
+
+    _raise_for_batch_errors(
+        responses,
+        errors,
+        f"Failed to ingest {len(errors)} of {len(chunks)} UDM event chunks; "
+        "the other chunks were ingested",
+    )
+    return _combine_batch_responses([responses[index] for index in sorted(responses)])
@@ -14,6 +14,8 @@
 #
 """Custom exceptions for Google SecOps SDK."""
 
+from typing import Any, Dict
+
 
 class SecOpsError(Exception):
     """Base exception for SecOps SDK."""
@@ -31,3 +33,25 @@ class APIError(SecOpsError):
     """Raised when an API request fails."""
 
     pass
+
+
+class BatchIngestError(APIError):
+    """Raised when an ingestion split across requests fails part way.
+
+    Raised only if at least one batch was ingested, so retrying the whole
+    call would ingest those batches again.
+
+    Attributes:
+        responses: Response of each ingested batch, keyed by batch index
+        errors: Error of each failed batch, keyed by batch index
+    """
+
+    def __init__(
+        self,
+        message: str,
+        responses: Dict[int, Dict[str, Any]],
+        errors: Dict[int, Exception],
+    ):
+        super().__init__(message)
+        self.responses = responses
+        self.errors = errors
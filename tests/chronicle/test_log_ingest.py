@@ -15,20 +15,25 @@
 """Tests for Chronicle log ingestion functionality."""
 import base64
 import json
+import uuid
 import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, patch
 
+from secops.chronicle import log_ingest
 from secops.chronicle.client import ChronicleClient
 from secops.chronicle.log_ingest import (
     ingest_log,
     get_or_create_forwarder,
     list_forwarders,
+    iter_forwarders,
     create_forwarder,
     extract_forwarder_id,
     ingest_udm,
+    _format_timestamp,
+    _new_event_id,
 )
-from secops.exceptions import APIError
+from secops.exceptions import APIError, BatchIngestError
 
 
 @pytest.fixture
@@ -125,6 +130,11 @@ def test_extract_forwarder_id():
     with pytest.raises(ValueError):
         extract_forwarder_id("/")
 
+    # Test with trailing and repeated slashes
+    assert extract_forwarder_id("forwarders//test-forwarder-id/") == "test-forwarder-id"
+    with pytest.raises(ValueError):
+        extract_forwarder_id("//")
+
 
 def test_create_forwarder(chronicle_client, mock_forwarder_response):
     """Test creating a forwarder."""
@@ -177,6 +187,133 @@ def test_list_forwarders_error(chronicle_client):
             list_forwarders(client=chronicle_client)
 
 
+def _forwarder_page(display_names, next_page_token=None):
+    """Create a mock forwarders list page response."""
+    mock = Mock()
+    mock.status_code = 200
+    page = {
+        "forwarders": [
+            {"name": f"forwarders/{name}-id", "displayName": name}
+            for name in display_names
+        ]
+    }
+    if next_page_token:
+        page["nextPageToken"] = next_page_token
+    mock.json.return_value = page
+    return mock
+
+
+def test_list_forwarders_single_page(chronicle_client):
+    """Test that a response without nextPageToken ends pagination."""
+    with patch.object(
+        chronicle_client.session, "get", return_value=_forwarder_page(["a"])
+    ) as mock_get:
+        result = list_forwarders(client=chronicle_client, page_size=1000)
+
+        assert result == {
+            "forwarders": [{"name": "forwarders/a-id", "displayName": "a"}]
+        }
+        mock_get.assert_called_once()
+        assert mock_get.call_args[1]["params"] == {"pageSize": 1000}
+
+
+def test_list_forwarders_multiple_pages(chronicle_client):
+    """Test that list_forwarders combines all pages."""
+    pages = [_forwarder_page(["a", "b"], "token-2"), _forwarder_page(["c"])]
+
+    with patch.object(chronicle_client.session, "get", side_effect=pages) as mock_get:
+        result = list_forwarders(client=chronicle_client)
+
+        assert [f["displayName"] for f in result["forwarders"]] == ["a", "b", "c"]
+        assert "nextPageToken" not in result
+        assert mock_get.call_count == 2
+        assert mock_get.call_args[1]["params"]["pageToken"] == "token-2"
+
+
+def test_iter_forwarders_is_lazy(chronicle_client):
+    """Test that iter_forwarders only fetches pages as they are consumed."""
+    pages = [_forwarder_page(["a"], "token-2"), _forwarder_page(["b"])]
+
+    with patch.object(chronicle_client.session, "get", side_effect=pages) as mock_get:
+        forwarders = iter_forwarders(client=chronicle_client)
+        assert next(forwarders)["displayName"] == "a"
+        assert mock_get.call_count == 1
+
+
+def test_get_or_create_forwarder_stops_at_match(chronicle_client):
+    """Test that the forwarder search stops requesting pages after a match."""
+    pages = [
+        _forwarder_page(["other"], "token-2"),
+        _forwarder_page(["target"], "token-3"),
+        _forwarder_page(["unused"]),
+    ]
+
+    with patch.object(chronicle_client.session, "get", side_effect=pages) as mock_get:
+        result = get_or_create_forwarder(client=chronicle_client, display_name="target")
+
+        assert result["displayName"] == "target"
+        assert mock_get.call_count == 2
+
+
+def test_get_or_create_forwarder_walks_all_pages_before_create(
+    chronicle_client, mock_forwarder_response
+):
+    """Test that every page is searched before a new forwarder is created."""
+    pages = [_forwarder_page(["a"], "token-2"), _forwarder_page(["b"])]
+
+    with patch.object(
+        chronicle_client.session, "get", side_effect=pages
+    ) as mock_get, patch.object(
+        chronicle_client.session, "post", return_value=mock_forwarder_response
+    ) as mock_post:
+        result = get_or_create_forwarder(
+            client=chronicle_client, display_name="Wrapper-SDK-Forwarder"
+        )
+
+        assert result["displayName"] == "Wrapper-SDK-Forwarder"
+        assert mock_get.call_count == 2
+        for call in mock_get.call_args_list:
+            assert call[1]["params"]["pageSize"] == 1000
+        mock_post.assert_called_once()
+
+
+def test_get_or_create_forwarder_uses_cache(chronicle_client):
+    """Test that named forwarder lookups are cached and validated by ID."""
+    list_page = _forwarder_page(["custom"])
+    get_response = Mock()
+    get_response.status_code = 200
+    get_response.json.return_value = {
+        "name": "forwarders/custom-id",
+        "displayName": "custom",
+    }
+
+    with patch.object(
+        chronicle_client.session, "get", side_effect=[list_page, get_response]
+    ) as mock_get:
+        get_or_create_forwarder(client=chronicle_client, display_name="custom")
+        result = get_or_create_forwarder(client=chronicle_client, display_name="custom")
+
+        assert result["displayName"] == "custom"
+        assert mock_get.call_count == 2
+        assert mock_get.call_args[0][0].endswith("/forwarders/custom-id")
+
+
+def test_get_or_create_forwarder_cache_expires(chronicle_client):
+    """Test that expired cache entries trigger a fresh lookup."""
+    chronicle_client._forwarder_id_cache["custom"] = ("stale-id", 0.0)
+
+    with patch.object(
+        chronicle_client.session, "get", return_value=_forwarder_page(["custom"])
+    ) as mock_get, patch(
+        "secops.chronicle.log_ingest.time.monotonic", return_value=10**6
+    ):
+        result = get_or_create_forwarder(client=chronicle_client, display_name="custom")
+
+        assert result["displayName"] == "custom"
+        mock_get.assert_called_once()
+        assert chronicle_client._forwarder_id_cache["custom"] == ("custom-id", 10**6)
+
+
 def test_get_or_create_forwarder_existing(
     chronicle_client, mock_forwarders_list_response
 ):
@@ -387,7 +524,7 @@ def test_ingest_udm_single_event(chronicle_client, mock_udm_event, mock_udm_resp
         )
 
         # Verify request payload
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         assert "inline_source" in payload
         assert "events" in payload["inline_source"]
         assert len(payload["inline_source"]["events"]) == 1
@@ -426,7 +563,7 @@ def test_ingest_udm_multiple_events(
         assert call_args is not None
 
         # Verify request payload
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         assert len(payload["inline_source"]["events"]) == 2
         event_ids = [
             e["udm"]["metadata"]["id"] for e in payload["inline_source"]["events"]
@@ -451,7 +588,7 @@ def test_ingest_udm_adds_missing_id(chronicle_client, mock_udm_response):
 
         # Verify ID was added
         call_args = chronicle_client.session.post.call_args
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         event_metadata = payload["inline_source"]["events"][0]["udm"]["metadata"]
         assert "id" in event_metadata
         assert event_metadata["id"]  # ID is not empty
@@ -474,7 +611,7 @@ def test_ingest_udm_adds_missing_timestamp(chronicle_client, mock_udm_response):
 
         # Verify timestamp was added
         call_args = chronicle_client.session.post.call_args
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         event_metadata = payload["inline_source"]["events"][0]["udm"]["metadata"]
         assert "event_timestamp" in event_metadata
         assert event_metadata["event_timestamp"]  # Timestamp is not empty
@@ -551,12 +688,40 @@ def test_ingest_log_batch(
         # Verify request payload
         call_args = chronicle_client.session.post.call_args
         assert call_args is not None
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         assert "inline_source" in payload
         assert "logs" in payload["inline_source"]
         assert len(payload["inline_source"]["logs"]) == 3
 
 
+def test_ingest_log_partial_batch_failure(chronicle_client, mock_ingest_response):
+    """Test that a failed batch reports the batches already ingested."""
+    error_response = Mock()
+    error_response.status_code = 500
+    error_response.text = "Internal error"
+
+    with patch.object(
+        chronicle_client.session,
+        "post",
+        side_effect=[mock_ingest_response, error_response],
+    ) as mock_post:
+        with pytest.raises(BatchIngestError, match="batch 1") as exc_info:
+            ingest_log(
+                client=chronicle_client,
+                log_type="OKTA",
+                log_message=["one", "two", "three", "four", "five"],
+                forwarder_id="custom-forwarder-id",
+                force_log_type=True,
+                batch_size=2,
+            )
+
+    # Sending stops at the failed batch
+    assert mock_post.call_count == 2
+    assert exc_info.value.responses == {0: mock_ingest_response.json.return_value}
+    assert list(exc_info.value.errors) == [1]
+    assert isinstance(exc_info.value, APIError)
+
+
 def test_ingest_log_backward_compatibility(
     chronicle_client, mock_forwarders_list_response, mock_ingest_response
 ):
@@ -581,7 +746,7 @@ def test_ingest_log_backward_compatibility(
         # Verify request payload still has the expected format
         call_args = chronicle_client.session.post.call_args
         assert call_args is not None
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         assert "inline_source" in payload
         assert "logs" in payload["inline_source"]
         assert len(payload["inline_source"]["logs"]) == 1
@@ -591,3 +756,234 @@ def test_ingest_log_backward_compatibility(
         assert "data" in log_entry
         decoded_data = base64.b64decode(log_entry["data"]).decode("utf-8")
         assert json.loads(decoded_data) == {"test": "log", "message": "Test message"}
+
+
+def test_ingest_log_batch_namespace_and_labels(
+    chronicle_client, mock_ingest_response
+):
+    """Test that namespace and labels are applied to every log in a batch."""
+    with patch.object(
+        chronicle_client.session, "post", return_value=mock_ingest_response
+    ), patch("secops.chronicle.log_ingest.is_valid_log_type", return_value=True):
+        ingest_log(
+            client=chronicle_client,
+            log_type="OKTA",
+            log_message=["first", "second"],
+            namespace="prod",
+            labels={"env": "test"},
+            forwarder_id="custom-forwarder-id",
+        )
+
+        payload = json.loads(chronicle_client.session.post.call_args[1]["data"])
+        logs = payload["inline_source"]["logs"]
+        assert [base64.b64decode(log["data"]).decode() for log in logs] == [
+            "first",
+            "second",
+        ]
+        for log in logs:
+            assert log["environment_namespace"] == "prod"
+            assert log["labels"] == {"env": {"value": "test"}}
+
+
+def test_ingest_log_bytes_message(chronicle_client, mock_ingest_response):
+    """Test that bytes log messages are encoded without re-encoding."""
+    with patch.object(
+        chronicle_client.session, "post", return_value=mock_ingest_response
+    ), patch("secops.chronicle.log_ingest.is_valid_log_type", return_value=True):
+        ingest_log(
+            client=chronicle_client,
+            log_type="OKTA",
+            log_message=[b"raw bytes", "café"],
+            forwarder_id="custom-forwarder-id",
+        )
+
+        payload = json.loads(chronicle_client.session.post.call_args[1]["data"])
+        logs = payload["inline_source"]["logs"]
+        assert base64.b64decode(logs[0]["data"]) == b"raw bytes"
+        assert base64.b64decode(logs[1]["data"]).decode("utf-8") == "café"
+
+
+def test_ingest_udm_does_not_modify_input(chronicle_client, mock_udm_response):
+    """Test that adding missing fields leaves the caller's events untouched."""
+    event = {
+        "metadata": {"event_type": "NETWORK_CONNECTION"},
+        "principal": {"ip": "192.168.1.100"},
+    }
+
+    with patch.object(chronicle_client.session, "post", return_value=mock_udm_response):
+        ingest_udm(client=chronicle_client, udm_events=[event])
+
+        payload = json.loads(chronicle_client.session.post.call_args[1]["data"])
+        sent = payload["inline_source"]["events"][0]["udm"]
+        assert "id" in sent["metadata"]
+        assert "event_timestamp" in sent["metadata"]
+        assert event["metadata"] == {"event_type": "NETWORK_CONNECTION"}
+        assert sent["principal"] == event["principal"]
+
+
+def test_format_timestamp_matches_strftime():
+    """Test that timestamp formatting matches the strftime format."""
+    dt = datetime(2025, 1, 2, 3, 4, 5, 6789, tzinfo=timezone.utc)
+    assert _format_timestamp(dt) == dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    assert _format_timestamp(dt) == "2025-01-02T03:04:05.006789Z"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_ingest_udm_serializes_json_body(
+    chronicle_client, mock_udm_event, mock_udm_response, use_orjson
+):
+    """Test that the request body is JSON with or without orjson installed."""
+    orjson_module = log_ingest.orjson if use_orjson else None
+    if use_orjson and orjson_module is None:
+        pytest.skip("orjson is not installed")
+
+    with patch.object(
+        chronicle_client.session, "post", return_value=mock_udm_response
+    ), patch.object(log_ingest, "orjson", orjson_module):
+        ingest_udm(client=chronicle_client, udm_events=mock_udm_event)
+
+        call_kwargs = chronicle_client.session.post.call_args[1]
+        assert call_kwargs["headers"]["Content-Type"] == "application/json"
+        assert isinstance(call_kwargs["data"], bytes)
+        payload = json.loads(call_kwargs["data"])
+        udm = payload["inline_source"]["events"][0]["udm"]
+        assert udm["metadata"]["id"] == "test-event-id"
+        assert udm["principal"] == mock_udm_event["principal"]
+
+
+def test_ingest_log_splits_into_batches(chronicle_client, mock_ingest_response):
+    """Test that large log lists are sent in several requests."""
+    with patch.object(
+        chronicle_client.session, "post", return_value=mock_ingest_response
+    ) as mock_post, patch(
+        "secops.chronicle.log_ingest.is_valid_log_type", return_value=True
+    ):
+        result = ingest_log(
+            client=chronicle_client,
+            log_type="OKTA",
+            log_message=[f"log {i}" for i in range(5)],
+            forwarder_id="custom-forwarder-id",
+            batch_size=2,
+        )
+
+        assert mock_post.call_count == 3
+        batch_sizes = [
+            len(json.loads(call[1]["data"])["inline_source"]["logs"])
+            for call in mock_post.call_args_list
+        ]
+        assert batch_sizes == [2, 2, 1]
+        assert len(result["batches"]) == 3
+        assert result["batches"][0]["operation"].endswith("operation-id")
+
+
+def test_ingest_log_invalid_batch_size(chronicle_client):
+    """Test that a non-positive batch size is rejected."""
+    with pytest.raises(ValueError, match="Batch size must be at least 1"):
+        ingest_log(
+            client=chronicle_client,
+            log_type="OKTA",
+            log_message="test",
+            batch_size=0,
+        )
+
+
+def test_new_event_id_is_uuid4():
+    """Test that generated event IDs are unique, dashed UUID4 strings."""
+    ids = {_new_event_id() for _ in range(100)}
+    assert len(ids) == 100
+    for event_id in ids:
+        parsed = uuid.UUID(event_id)
+        assert str(parsed) == event_id
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+
+
+def test_ingest_udm_concurrent_batches(chronicle_client, mock_udm_response):
+    """Test that events are split across concurrent requests."""
+    events = [
+        {"metadata": {"event_type": "GENERIC_EVENT", "id": f"event-{i}"}}
+        for i in range(5)
+    ]
+
+    with patch.object(
+        chronicle_client.session, "post", return_value=mock_udm_response
+    ) as mock_post:
+        result = ingest_udm(client=chronicle_client, udm_events=events, max_workers=2)
+
+        assert mock_post.call_count == 2
+        sent_ids = sorted(
+            event["udm"]["metadata"]["id"]
+            for call in mock_post.call_args_list
+            for event in json.loads(call[1]["data"])["inline_source"]["events"]
+        )
+        assert sent_ids == [f"event-{i}" for i in range(5)]
+        assert result == {"batches": [{}, {}]}
+
+
+def test_ingest_udm_concurrent_partial_failure(chronicle_client, mock_udm_response):
+    """Test that every chunk is sent and its outcome reported when one fails."""
+    events = [
+        {"metadata": {"event_type": "GENERIC_EVENT", "id": f"event-{i}"}}
+        for i in range(6)
+    ]
+    error_response = Mock()
+    error_response.status_code = 500
+    error_response.text = "Internal error"
+
+    def post(url, data, headers):
+        sent = json.loads(data)["inline_source"]["events"]
+        if sent[0]["udm"]["metadata"]["id"] == "event-0":
+            return error_response
+        return mock_udm_response
+
+    with patch.object(chronicle_client.session, "post", side_effect=post) as mock_post:
+        with pytest.raises(BatchIngestError, match="1 of 3") as exc_info:
+            ingest_udm(client=chronicle_client, udm_events=events, max_workers=3)
+
+    assert mock_post.call_count == 3
+    assert sorted(exc_info.value.responses) == [1, 2]
+    assert list(exc_info.value.errors) == [0]
+
+    # If every chunk fails nothing was ingested, so the plain error is raised
+    with patch.object(chronicle_client.session, "post", return_value=error_response):
+        with pytest.raises(APIError) as exc_info:
+            ingest_udm(client=chronicle_client, udm_events=events, max_workers=3)
+    assert not isinstance(exc_info.value, BatchIngestError)
+
+
+def test_ingest_udm_validation_error_invalid_metadata(chronicle_client):
+    """Test validation error when metadata is not a dictionary."""
+    with pytest.raises(ValueError, match="UDM 'metadata' must be a dictionary"):
+        ingest_udm(client=chronicle_client, udm_events={"metadata": None})
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_serialize_payload_rejects_datetimes(use_orjson):
+    """Test that datetimes are rejected with or without orjson installed."""
+    orjson_module = log_ingest.orjson if use_orjson else None
+    if use_orjson and orjson_module is None:
+        pytest.skip("orjson is not installed")
+
+    with patch.object(log_ingest, "orjson", orjson_module):
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            log_ingest._serialize_payload({"when": datetime.now()})
+
+
+def test_serialize_payload_rejects_nan_without_orjson():
+    """Test that the standard library fallback rejects NaN like requests did."""
+    with patch.object(log_ingest, "orjson", None):
+        with pytest.raises(ValueError):
+            log_ingest._serialize_payload({"value": float("nan")})
+
+
+def test_ingest_log_empty_list(chronicle_client):
+    """Test that an empty list of log messages is rejected before any request."""
+    with patch.object(chronicle_client.session, "post") as mock_post:
+        with pytest.raises(ValueError, match="No log messages provided"):
+            ingest_log(
+                client=chronicle_client,
+                log_type="OKTA",
+                log_message=[],
+                forwarder_id="custom-forwarder-id",
+            )
+        mock_post.assert_not_called()
@@ -0,0 +1,271 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for asynchronous Chronicle log ingestion."""
+import asyncio
+import base64
+import json
+import httpx
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from secops.chronicle import log_ingest_async
+from secops.chronicle.client import ChronicleClient
+from secops.chronicle.log_ingest_async import aingest_log, aingest_udm
+from secops.exceptions import APIError, BatchIngestError, SecOpsError
+
+
+@pytest.fixture
+def chronicle_client():
+    """Create a Chronicle client for testing."""
+    return ChronicleClient(
+        customer_id="test-customer", project_id="test-project", region="us"
+    )
+
+
+@pytest.fixture
+def http_client(chronicle_client):
+    """Attach a mock async HTTP client and stub out token handling."""
+    ok_response = Mock()
+    ok_response.status_code = 200
+    ok_response.text = '{"operation": "operation-id"}'
+    ok_response.json.return_value = {"operation": "operation-id"}
+
+    mock_client = Mock()
+    mock_client.post = AsyncMock(return_value=ok_response)
+
+    def add_token(request, method, url, headers):
+        headers["authorization"] = "Bearer test-token"
+
+    with patch.object(
+        log_ingest_async, "_get_async_http_client", return_value=mock_client
+    ), patch.object(
+        chronicle_client.session.credentials, "before_request", side_effect=add_token
+    ) as mock_before_request:
+        mock_client.before_request = mock_before_request
+        yield mock_client
+
+
+def test_aingest_log_batches(chronicle_client, http_client):
+    """Test that async log ingestion sends each batch with auth headers."""
+    result = asyncio.run(
+        aingest_log(
+            chronicle_client,
+            log_type="OKTA",
+            log_message=["one", "two", "three"],
+            forwarder_id="custom-forwarder-id",
+            force_log_type=True,
+            batch_size=2,
+        )
+    )
+
+    assert http_client.post.call_count == 2
+    first_call = http_client.post.call_args_list[0]
+    assert first_call[0][0].endswith("/logTypes/OKTA/logs:import")
+    assert first_call[1]["headers"]["authorization"] == "Bearer test-token"
+    logs = json.loads(first_call[1]["content"])["inline_source"]["logs"]
+    assert [base64.b64decode(log["data"]) for log in logs] == [b"one", b"two"]
+    assert result == {"batches": [{"operation": "operation-id"}] * 2}
+    # Each batch gets freshly validated auth headers
+    assert http_client.before_request.call_count == 2
+
+
+def test_aingest_log_max_concurrency(chronicle_client, http_client):
+    """Test that no more than max_concurrency batches are in flight at once."""
+    in_flight = 0
+    peak = 0
+
+    async def post(url, content, headers):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        log = json.loads(content)["inline_source"]["logs"][0]
+        index = int(base64.b64decode(log["data"]).decode("utf-8").split("-")[1])
+        # Later batches finish first
+        await asyncio.sleep(0.001 * (10 - index))
+        in_flight -= 1
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"operation": f"operation-{index}"}
+        return response
+
+    http_client.post.side_effect = post
+
+    result = asyncio.run(
+        aingest_log(
+            chronicle_client,
+            log_type="OKTA",
+            log_message=[f"log-{i}" for i in range(10)],
+            forwarder_id="custom-forwarder-id",
+            force_log_type=True,
+            batch_size=1,
+            max_concurrency=3,
+        )
+    )
+
+    assert http_client.post.call_count == 10
+    assert peak == 3
+    # Responses are returned in batch order regardless of completion order
+    assert result["batches"] == [{"operation": f"operation-{i}"} for i in range(10)]
+
+
+def test_aingest_log_error(chronicle_client, http_client):
+    """Test that failed async log imports raise APIError."""
+    http_client.post.return_value.status_code = 400
+
+    with pytest.raises(APIError, match="Failed to ingest log"):
+        asyncio.run(
+            aingest_log(
+                chronicle_client,
+                log_type="OKTA",
+                log_message="test",
+                forwarder_id="custom-forwarder-id",
+                force_log_type=True,
+            )
+        )
+
+
+def test_aingest_log_transport_error(chronicle_client, http_client):
+    """Test that httpx transport errors are raised as APIError."""
+    http_client.post.side_effect = httpx.ReadTimeout("timed out")
+
+    with pytest.raises(APIError, match="Failed to ingest log: timed out"):
+        asyncio.run(
+            aingest_log(
+                chronicle_client,
+                log_type="OKTA",
+                log_message="test",
+                forwarder_id="custom-forwarder-id",
+                force_log_type=True,
+            )
+        )
+
+
+def test_aingest_log_partial_batch_failure(chronicle_client, http_client):
+    """Test that a failed batch stops sending and reports ingested batches."""
+    ok_response = http_client.post.return_value
+    error_response = Mock()
+    error_response.status_code = 500
+    error_response.text = "Internal error"
+    http_client.post.side_effect = [ok_response, error_response]
+
+    with pytest.raises(BatchIngestError) as exc_info:
+        asyncio.run(
+            aingest_log(
+                chronicle_client,
+                log_type="OKTA",
+                log_message=["one", "two", "three", "four", "five"],
+                forwarder_id="custom-forwarder-id",
+                force_log_type=True,
+                batch_size=2,
+            )
+        )
+
+    assert http_client.post.call_count == 2
+    assert exc_info.value.responses == {0: {"operation": "operation-id"}}
+    assert list(exc_info.value.errors) == [1]
+
+
+def test_aingest_udm_partial_failure(chronicle_client, http_client):
+    """Test that every UDM chunk is sent and its outcome reported."""
+    ok_response = http_client.post.return_value
+    error_response = Mock()
+    error_response.status_code = 500
+    error_response.text = "Internal error"
+    events = [
+        {"metadata": {"event_type": "GENERIC_EVENT", "id": f"event-{i}"}}
+        for i in range(3)
+    ]
+
+    async def post(url, content, headers):
+        sent = json.loads(content)["inline_source"]["events"]
+        if sent[0]["udm"]["metadata"]["id"] == "event-0":
+            return error_response
+        return ok_response
+
+    http_client.post.side_effect = post
+
+    with pytest.raises(BatchIngestError, match="1 of 3") as exc_info:
+        asyncio.run(aingest_udm(chronicle_client, events, max_concurrency=3))
+
+    assert http_client.post.call_count == 3
+    assert sorted(exc_info.value.responses) == [1, 2]
+    assert list(exc_info.value.errors) == [0]
+
+
+def test_aingest_udm(chronicle_client, http_client):
+    """Test that async UDM ingestion splits events across requests."""
+    events = [{"metadata": {"event_type": "GENERIC_EVENT"}} for _ in range(3)]
+
+    result = asyncio.run(aingest_udm(chronicle_client, events, max_concurrency=3))
+
+    assert http_client.post.call_count == 3
+    body = json.loads(http_client.post.call_args[1]["content"])
+    assert "id" in body["inline_source"]["events"][0]["udm"]["metadata"]
+    assert len(result["batches"]) == 3
+    assert http_client.before_request.call_count == 3
+
+
+def test_aingest_requires_httpx(chronicle_client):
+    """Test that a helpful error is raised when httpx is missing."""
+    with patch.object(log_ingest_async, "httpx", None):
+        with pytest.raises(SecOpsError, match="requires httpx"):
+            asyncio.run(
+                aingest_udm(chronicle_client, {"metadata": {"id": "test-id"}})
+            )
+
+
+def test_async_client_rebuilt_for_new_event_loop(chronicle_client):
+    """Test that the shared HTTP/2 client is not reused across event loops."""
+
+    async def get_client():
+        return log_ingest_async._get_async_http_client(chronicle_client)
+
+    with patch.object(log_ingest_async, "httpx") as mock_httpx:
+        mock_httpx.AsyncClient.side_effect = lambda **kwargs: Mock()
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+    assert first is not second
+    assert mock_httpx.AsyncClient.call_count == 2
+
+
+def test_aingest_requires_h2(chronicle_client):
+    """Test that a missing h2 package raises SecOpsError."""
+    with patch.object(log_ingest_async, "httpx") as mock_httpx:
+        mock_httpx.AsyncClient.side_effect = ImportError("h2 is not installed")
+        with pytest.raises(SecOpsError, match="requires httpx"):
+            asyncio.run(
+                aingest_udm(chronicle_client, {"metadata": {"id": "test-id"}})
+            )
+
+
+def test_async_client_settings(chronicle_client, monkeypatch, tmp_path):
+    """Test that the HTTP/2 client disables timeouts and honours REQUESTS_CA_BUNDLE."""
+    ca_bundle = tmp_path / "ca.pem"
+    ca_bundle.write_text("")
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", str(ca_bundle))
+
+    async def get_client():
+        return log_ingest_async._get_async_http_client(chronicle_client)
+
+    with patch.object(log_ingest_async, "httpx") as mock_httpx, patch(
+        "secops.chronicle.log_ingest_async.ssl.create_default_context"
+    ) as mock_context:
+        asyncio.run(get_client())
+
+    mock_context.assert_called_once_with(cafile=str(ca_bundle))
+    kwargs = mock_httpx.AsyncClient.call_args[1]
+    assert kwargs["timeout"] is None
+    assert kwargs["verify"] is mock_context.return_value
@@ -13,12 +13,37 @@
 # limitations under the License.
 #
 """Tests for authentication functionality."""
+import gc
 import pytest
-from secops.auth import SecOpsAuth, CHRONICLE_SCOPES
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+from google.auth.exceptions import RefreshError
+from urllib3.exceptions import ConnectTimeoutError, ReadTimeoutError
+from secops.auth import (
+    SecOpsAuth,
+    CHRONICLE_SCOPES,
+    _RefreshAheadSession,
+    _SHARED_SESSIONS,
+    _TokenRefresher,
+    _load_default_credentials,
+    _load_sa_file,
+)
 from secops.exceptions import AuthenticationError
 from config import SERVICE_ACCOUNT_JSON
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_caches():
+    """Isolate tests from credentials and sessions cached by earlier tests."""
+    _load_default_credentials.cache_clear()
+    _load_sa_file.cache_clear()
+    _SHARED_SESSIONS.clear()
+    yield
+    _load_default_credentials.cache_clear()
+    _load_sa_file.cache_clear()
+    _SHARED_SESSIONS.clear()
+
+
 def test_default_auth():
     """Test authentication with default credentials."""
     auth = SecOpsAuth()
@@ -29,8 +54,9 @@ def test_default_auth():
 
 def test_invalid_service_account_path():
     """Test authentication with invalid service account path."""
+    auth = SecOpsAuth(service_account_path="invalid/path.json")
     with pytest.raises(AuthenticationError):
-        SecOpsAuth(service_account_path="invalid/path.json")
+        auth.credentials
 
 
 def test_service_account_info():
@@ -46,8 +72,9 @@ def test_service_account_info():
 
 def test_invalid_service_account_info():
     """Test authentication with invalid service account JSON data."""
+    auth = SecOpsAuth(service_account_info={"invalid": "data"})
     with pytest.raises(AuthenticationError):
-        SecOpsAuth(service_account_info={"invalid": "data"})
+        auth.credentials
 
 
 def test_custom_scopes():
@@ -65,3 +92,154 @@ def test_custom_user_agent():
     assert session is not None
     assert hasattr(session, "headers")
     assert session.headers.get("User-Agent") == "secops-wrapper-sdk"
+
+
+def test_session_connection_pool():
+    """Test that the session mounts a tuned HTTPS adapter."""
+    auth = SecOpsAuth(
+        service_account_info=SERVICE_ACCOUNT_JSON, pool_connections=8, pool_maxsize=16
+    )
+    adapter = auth.session.get_adapter("https://chronicle.googleapis.com")
+    assert adapter._pool_connections == 8
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_session_does_not_retry_processed_posts():
+    """Test that POSTs are only retried when the server did not process them."""
+    auth = SecOpsAuth(service_account_info=SERVICE_ACCOUNT_JSON)
+    retry = auth.session.get_adapter("https://chronicle.googleapis.com").max_retries
+
+    assert not retry.is_retry("POST", 503)
+    assert not retry.is_retry("POST", 500)
+    assert retry.is_retry("POST", 429)
+    assert retry.is_retry("GET", 503)
+
+    # Read errors are only retried for idempotent methods
+    error = ReadTimeoutError(None, "/", "read timed out")
+    with pytest.raises(ReadTimeoutError):
+        retry.increment("POST", "/", error=error)
+    assert retry.increment("GET", "/", error=error).total == 2
+
+    # Connection errors mean the request was never sent, so POSTs retry
+    connect_error = ConnectTimeoutError("connect timed out")
+    assert retry.increment("POST", "/", error=connect_error).total == 2
+
+
+def test_default_credentials_and_session_shared():
+    """Test that default credentials and sessions are reused across instances."""
+    first = SecOpsAuth()
+    second = SecOpsAuth()
+    assert first.credentials is second.credentials
+    assert first.session is second.session
+
+    other_scopes = SecOpsAuth(
+        scopes=["https://www.googleapis.com/auth/chronicle-backstory"]
+    )
+    assert other_scopes.credentials is not first.credentials
+    assert other_scopes.session is not first.session
+
+
+def test_credentials_resolved_lazily():
+    """Test that credentials are not loaded until first accessed."""
+    with patch.object(
+        SecOpsAuth, "_get_credentials", return_value=Mock()
+    ) as mock_get:
+        auth = SecOpsAuth(service_account_path="unused/path.json")
+        mock_get.assert_not_called()
+
+        assert auth.credentials is auth.credentials
+        mock_get.assert_called_once_with(None, "unused/path.json", None)
+
+
+def test_token_refresh_scheduled_before_expiry():
+    """Test that a refresh is scheduled ahead of token expiry."""
+    credentials = Mock()
+    credentials.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+        seconds=1000
+    )
+    refresher = _TokenRefresher(credentials)
+
+    with patch("secops.auth.threading.Timer") as mock_timer:
+        refresher.schedule()
+        # Scheduling again for the same token is a no-op
+        refresher.schedule()
+
+    mock_timer.assert_called_once()
+    delay = mock_timer.call_args[0][0]
+    assert 740 <= delay <= 800
+    mock_timer.return_value.start.assert_called_once()
+
+
+def test_token_refresh_failure_falls_back_to_inline():
+    """Test that a failed background refresh does not raise."""
+    credentials = Mock()
+    credentials.refresh.side_effect = RefreshError("boom")
+    refresher = _TokenRefresher(credentials)
+
+    with patch("secops.auth.threading.Timer") as mock_timer:
+        refresher._refresh()
+
+    credentials.refresh.assert_called_once()
+    mock_timer.assert_not_called()
+
+
+def test_session_shared_for_same_service_account():
+    """Test that separately loaded copies of a key share one session."""
+    first = SecOpsAuth(service_account_info=SERVICE_ACCOUNT_JSON)
+    second = SecOpsAuth(service_account_info=SERVICE_ACCOUNT_JSON)
+    assert first.credentials is not second.credentials
+    assert first.session is second.session
+
+    delegated = SecOpsAuth(
+        credentials=first.credentials.with_subject("user@example.com")
+    )
+    assert delegated.session is not first.session
+    # Passed-in credentials never share with other instances
+    assert SecOpsAuth(credentials=first.credentials).session is not first.session
+    assert (
+        SecOpsAuth(credentials=first.credentials).session
+        is not SecOpsAuth(credentials=first.credentials).session
+    )
+
+    for field, value in [
+        ("private_key_id", "other-key-id"),
+        ("token_uri", "https://oauth2.example.com/token"),
+        ("universe_domain", "example.com"),
+    ]:
+        other = SecOpsAuth(service_account_info={**SERVICE_ACCOUNT_JSON, field: value})
+        assert other.session is not first.session, field
+
+
+def test_token_refresh_does_not_reschedule_itself():
+    """Test that a background refresh does not start another refresh."""
+    credentials = Mock()
+    refresher = _TokenRefresher(credentials)
+
+    with patch("secops.auth.threading.Timer") as mock_timer:
+        refresher._refresh()
+
+    credentials.refresh.assert_called_once()
+    mock_timer.assert_not_called()
+
+
+def test_session_release_cancels_pending_refresh():
+    """Test that closing or collecting a session cancels its refresh timer."""
+    credentials = Mock()
+    credentials.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+        seconds=1000
+    )
+
+    with patch("secops.auth.threading.Timer") as mock_timer:
+        session = _RefreshAheadSession(credentials)
+        session._refresher.schedule()
+        session.close()
+        mock_timer.return_value.cancel.assert_called_once()
+
+        mock_timer.reset_mock()
+        session = _RefreshAheadSession(credentials)
+        session._refresher.schedule()
+        del session
+        gc.collect()
+        mock_timer.return_value.cancel.assert_called_once()